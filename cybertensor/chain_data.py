@@ -658,6 +658,10 @@ class SubnetHyperparameters:
     # serving_rate_limit: int
     # max_validators: int
 
+    # Field names in declaration order. Slotted instances have no __dict__ to walk.
+    _fields = tuple(__annotations__)
+    __slots__ = _fields
+
     @classmethod
     def from_list_any(cls, list_any: List[Any]) -> Optional["SubnetHyperparameters"]:
         if len(list_any) == 0:
@@ -700,7 +704,9 @@ class SubnetHyperparameters:
 
     def to_parameter_dict(self) -> "torch.nn.ParameterDict":
         r"""Returns a torch tensor of the subnet hyperparameters."""
-        return torch.nn.ParameterDict(self.__dict__)
+        return torch.nn.ParameterDict(
+            {name: getattr(self, name) for name in self._fields}
+        )
 
     @classmethod
     def from_parameter_dict(
@@ -257,8 +257,31 @@ class cli:
             parser.print_help()
             sys.exit()
 
+        cli.__add_lazy_args__(parser, args)
+
         return Config(parser, args=args)
 
+    @staticmethod
+    def __add_lazy_args__(parser: "argparse.ArgumentParser", args: List[str]):
+        """
+        Lets the selected subcommand finish building its arguments. Commands may defer
+        expensive argument setup by storing a callable as their ``_lazy_args`` default.
+
+        Args:
+            parser (argparse.ArgumentParser): The Cybertensor CLI argument parser.
+            args (List[str]): List of command line arguments.
+        """
+        # Walk down the command/subcommand parsers named in args.
+        for arg in args:
+            for action in parser._actions:
+                if isinstance(action, argparse._SubParsersAction) and arg in action.choices:
+                    parser = action.choices[arg]
+                    break
+
+        build_args = parser.get_default("_lazy_args")
+        if build_args is not None:
+            build_args()
+
     @staticmethod
     def check_config(config: "Config"):
         """
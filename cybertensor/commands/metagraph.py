@@ -22,7 +22,7 @@ from rich.table import Table
 
 import cybertensor
 from cybertensor import __console__ as console
-from cybertensor.commands.utils import check_netuid_set
+from cybertensor.commands.utils import check_netuid_set, get_cwtensor
 from cybertensor.config import Config
 from cybertensor.utils.balance import Balance
 
@@ -76,13 +76,8 @@ class MetagraphCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""Prints an entire metagraph."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            MetagraphCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        MetagraphCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
@@ -92,55 +87,19 @@ class MetagraphCommand:
             )
         )
         metagraph: cybertensor.metagraph = cwtensor.metagraph(netuid=cli.config.netuid)
-        metagraph.save()
+        # Snapshots are stored per block, skip re-serializing one that is already on disk.
+        metagraph.save(overwrite=False)
         difficulty = cwtensor.difficulty(cli.config.netuid)
         # subnet_emission = Balance.from_gboot(
         #     cwtensor.get_emission_value_by_subnet(cli.config.netuid)
         # )
         total_issuance = Balance.from_boot(cwtensor.total_issuance().boot)
 
-        TABLE_DATA = []
-        total_stake = 0.0
-        total_rank = 0.0
-        total_validator_trust = 0.0
-        total_trust = 0.0
-        total_consensus = 0.0
-        total_incentive = 0.0
-        total_dividends = 0.0
-        total_emission = 0
-        for uid in metagraph.uids:
-            neuron = metagraph.neurons[uid]
-            ep = metagraph.axons[uid]
-            row = [
-                str(neuron.uid),
-                "{:.5f}".format(metagraph.total_stake[uid]),
-                "{:.5f}".format(metagraph.ranks[uid]),
-                "{:.5f}".format(metagraph.trust[uid]),
-                "{:.5f}".format(metagraph.consensus[uid]),
-                "{:.5f}".format(metagraph.incentive[uid]),
-                "{:.5f}".format(metagraph.dividends[uid]),
-                "{}".format(int(metagraph.emission[uid] * 1000000000)),
-                "{:.5f}".format(metagraph.validator_trust[uid]),
-                "*" if metagraph.validator_permit[uid] else "",
-                str((metagraph.block.item() - metagraph.last_update[uid].item())),
-                str(metagraph.active[uid].item()),
-                (
-                    ep.ip + ":" + str(ep.port)
-                    if ep.is_serving
-                    else "[yellow]none[/yellow]"
-                ),
-                f"{ep.hotkey[:14]}...{ep.hotkey[-6:]}",
-                f"{ep.coldkey[:14]}...{ep.coldkey[-6:]}"
-            ]
-            total_stake += metagraph.total_stake[uid]
-            total_rank += metagraph.ranks[uid]
-            total_validator_trust += metagraph.validator_trust[uid]
-            total_trust += metagraph.trust[uid]
-            total_consensus += metagraph.consensus[uid]
-            total_incentive += metagraph.incentive[uid]
-            total_dividends += metagraph.dividends[uid]
-            total_emission += int(metagraph.emission[uid] * 1000000000)
-            TABLE_DATA.append(row)
+        # Accumulate stake in integer boot units to avoid float rounding drift.
+        total_stake = Balance.from_boot(
+            sum(neuron.total_stake.boot for neuron in metagraph.neurons)
+        )
+
         total_neurons = len(metagraph.uids)
         table = Table(show_footer=False)
         table.title = "[white]Metagraph: net: {}:{}, block: {}, N: {}/{}, stake: {}, issuance: {}, difficulty: {}".format(
@@ -149,10 +108,11 @@ class MetagraphCommand:
             metagraph.block.item(),
             sum(metagraph.active.tolist()),
             metagraph.n.item(),
-            Balance.from_gboot(total_stake),
+            total_stake,
             total_issuance,
             difficulty,
         )
+        # Footers are filled in once the totals are known, rows are added as they are built.
         table.add_column(
             "[overline white]UID",
             str(total_neurons),
@@ -161,7 +121,7 @@ class MetagraphCommand:
         )
         table.add_column(
             f"[overline white]STAKE({cwtensor.giga_token_symbol})",
-            f"{cwtensor.giga_token_symbol}{total_stake:.5f}",
+            f"{cwtensor.giga_token_symbol}{total_stake.gboot:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -169,7 +129,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]RANK",
-            f"{total_rank:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -177,7 +136,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]TRUST",
-            f"{total_trust:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -185,7 +143,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]CONSENSUS",
-            f"{total_consensus:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -193,7 +150,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]INCENTIVE",
-            f"{total_incentive:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -201,7 +157,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]DIVIDENDS",
-            f"{total_dividends:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -209,7 +164,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]EMISSION(\u03C1)",
-            f"\u03C1{int(total_emission)}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -217,7 +171,6 @@ class MetagraphCommand:
         )
         table.add_column(
             "[overline white]VTRUST",
-            f"{total_validator_trust:.5f}",
             footer_style="overline white",
             justify="right",
             style="green",
@@ -235,10 +188,57 @@ class MetagraphCommand:
         )
         table.add_column("[overline white]HOTKEY", style="dim blue", no_wrap=False)
         table.add_column("[overline white]COLDKEY", style="dim purple", no_wrap=False)
+
+        total_rank = 0.0
+        total_validator_trust = 0.0
+        total_trust = 0.0
+        total_consensus = 0.0
+        total_incentive = 0.0
+        total_dividends = 0.0
+        total_emission = 0
+        # Render the per-axon columns once instead of dispatching properties per row.
+        axon_strs = [
+            f"{axon.ip}:{axon.port}" if axon.is_serving else "[yellow]none[/yellow]"
+            for axon in metagraph.axons
+        ]
+        hotkey_strs = [f"{axon.hotkey[:14]}...{axon.hotkey[-6:]}" for axon in metagraph.axons]
+        coldkey_strs = [f"{axon.coldkey[:14]}...{axon.coldkey[-6:]}" for axon in metagraph.axons]
+        for uid in metagraph.uids:
+            neuron = metagraph.neurons[uid]
+            table.add_row(
+                str(neuron.uid),
+                "{:.5f}".format(metagraph.total_stake[uid]),
+                "{:.5f}".format(metagraph.ranks[uid]),
+                "{:.5f}".format(metagraph.trust[uid]),
+                "{:.5f}".format(metagraph.consensus[uid]),
+                "{:.5f}".format(metagraph.incentive[uid]),
+                "{:.5f}".format(metagraph.dividends[uid]),
+                "{}".format(int(metagraph.emission[uid] * 1000000000)),
+                "{:.5f}".format(metagraph.validator_trust[uid]),
+                "*" if metagraph.validator_permit[uid] else "",
+                str((metagraph.block.item() - metagraph.last_update[uid].item())),
+                str(metagraph.active[uid].item()),
+                axon_strs[uid],
+                hotkey_strs[uid],
+                coldkey_strs[uid],
+            )
+            total_rank += metagraph.ranks[uid]
+            total_validator_trust += metagraph.validator_trust[uid]
+            total_trust += metagraph.trust[uid]
+            total_consensus += metagraph.consensus[uid]
+            total_incentive += metagraph.incentive[uid]
+            total_dividends += metagraph.dividends[uid]
+            total_emission += int(metagraph.emission[uid] * 1000000000)
+
+        table.columns[2].footer = f"{total_rank:.5f}"
+        table.columns[3].footer = f"{total_trust:.5f}"
+        table.columns[4].footer = f"{total_consensus:.5f}"
+        table.columns[5].footer = f"{total_incentive:.5f}"
+        table.columns[6].footer = f"{total_dividends:.5f}"
+        table.columns[7].footer = f"\u03C1{int(total_emission)}"
+        table.columns[8].footer = f"{total_validator_trust:.5f}"
         table.show_footer = True
 
-        for row in TABLE_DATA:
-            table.add_row(*row)
         table.box = None
         table.pad_edge = False
         table.width = None
@@ -246,7 +246,7 @@ class MetagraphCommand:
 
     @staticmethod
     def check_config(config: "Config"):
-        check_netuid_set(config, cwtensor=cybertensor.cwtensor(config=config, log_verbose=False))
+        check_netuid_set(config, cwtensor=get_cwtensor(config))
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -17,22 +17,29 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
-import re
-from typing import List, Optional, Dict
+from typing import List
 
 import numpy as np
-import torch
 from rich.prompt import Prompt
 from rich.table import Table
 
 import cybertensor
 from cybertensor import __console__ as console
 from cybertensor.commands import defaults
-from cybertensor.commands.utils import DelegatesDetails, check_netuid_set
+from cybertensor.commands.utils import (
+    cached_subnet_query,
+    check_netuid_set,
+    defer_args,
+    get_cwtensor,
+    invalidate_subnet,
+)
 from cybertensor.config import Config
 from cybertensor.wallet import Wallet
 # from cybertensor.commands.identity import SetIdentityCommand
 
+_DEFAULT_WALLET_NAME = defaults.wallet.name
+_CREATE_HELP = "Create a new cybertensor subnetwork on this chain."
+
 
 class RegisterSubnetworkCommand:
     """
@@ -71,25 +78,23 @@ class RegisterSubnetworkCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""Register a subnetwork"""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            RegisterSubnetworkCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        RegisterSubnetworkCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
 
-        config = cli.config.copy()
-        wallet = Wallet(config=cli.config)
-        cwtensor = cybertensor.cwtensor(config=config)
+        config = cli.config
+        no_prompt = config.no_prompt
+        wallet = Wallet(config=config)
         # Call register command.
         success = cwtensor.register_subnetwork(
             wallet=wallet,
-            prompt=not cli.config.no_prompt,
+            prompt=not no_prompt,
         )
+        if success:
+            # The new netuid is unknown here, so drop every cached subnet query.
+            invalidate_subnet(cwtensor)
         # if success and not cli.config.no_prompt:
         #     # Prompt for user to set identity.
         #     do_set_identity = Prompt.ask(
@@ -106,19 +111,16 @@ class RegisterSubnetworkCommand:
 
     @classmethod
     def check_config(cls, config: "Config"):
-        if not config.is_set("wallet.name") and not config.no_prompt:
-            wallet_name = Prompt.ask("Enter wallet name", default=defaults.wallet.name)
-            config.wallet.name = str(wallet_name)
+        if config.no_prompt or config.is_set("wallet.name"):
+            return
+
+        wallet_name = Prompt.ask("Enter wallet name", default=_DEFAULT_WALLET_NAME)
+        config.wallet.name = str(wallet_name)
 
     @classmethod
     def add_args(cls, parser: argparse.ArgumentParser):
-        parser = parser.add_parser(
-            "create",
-            help="""Create a new cybertensor subnetwork on this chain.""",
-        )
-
-        Wallet.add_args(parser)
-        cybertensor.cwtensor.add_args(parser)
+        parser = parser.add_parser("create", help=_CREATE_HELP)
+        defer_args(parser, Wallet.add_args, cybertensor.cwtensor.add_args)
 
 
 class SubnetLockCostCommand:
@@ -151,18 +153,11 @@ class SubnetLockCostCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""View locking cost of creating a new subnetwork"""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetLockCostCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetLockCostCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
-
-        config = cli.config.copy()
         try:
             console.print(
                 f"Subnet lock cost: [green]{cybertensor.Balance( cwtensor.get_subnet_burn_cost() )}[/green]"
@@ -223,45 +218,23 @@ class SubnetListCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""List all subnet netuids in the network."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetListCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetListCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
 
-        subnets: List[cybertensor.SubnetInfo] = cwtensor.get_all_subnets_info()
-
-        rows = []
-        total_neurons = 0
         # TODO revisist
         # delegate_info: Optional[Dict[str, DelegatesDetails]] = get_delegates_details(
         #     url=cybertensor.__delegates_details_url__
         # )
 
-        delegate_info: Optional[Dict[str, DelegatesDetails]] = cwtensor.get_delegates()
-
-        for subnet in subnets:
-            total_neurons += subnet.max_n
-            rows.append(
-                (
-                    str(subnet.netuid),
-                    str(subnet.subnetwork_n),
-                    str(cybertensor.utils.formatting.millify(subnet.max_n)),
-                    f"{subnet.emission_value / cybertensor.utils.GIGA * 100:0.2f}%",
-                    str(subnet.tempo),
-                    f"{subnet.burn!s:8.8}",
-                    str(cybertensor.utils.formatting.millify(subnet.difficulty)),
-                    # TODO revisit
-                    # f"{delegate_info[subnet.owner_ss58].name if subnet.owner_ss58 in delegate_info else subnet.owner_ss58}",
-                    f"{delegate_info[subnet.owner].owner if subnet.owner in delegate_info else subnet.owner}",
-                    f"{subnet.metadata}",
-                )
-            )
+        subnets: List[cybertensor.SubnetInfo] = cached_subnet_query(
+            cwtensor, "get_all_subnets_info"
+        )
+
+        total_neurons = sum(subnet.max_n for subnet in subnets)
+
         table = Table(
             show_footer=True,
             width=cli.config.get("width", None),
@@ -291,9 +264,41 @@ class SubnetListCommand:
         table.add_column("[overline white]POW", style="white", justify="center")
         table.add_column("[overline white]SUDO", style="white")
         table.add_column("[overline white]METADATA", style="white")
-        for row in rows:
-            table.add_row(*row)
-        console.print(table)
+
+        # Format the numeric columns for all subnets at once.
+        millify_array = cybertensor.utils.formatting.millify_array
+        count = len(subnets)
+        max_n_strs = millify_array(
+            np.fromiter((subnet.max_n for subnet in subnets), np.float64, count)
+        ).tolist()
+        difficulty_strs = millify_array(
+            np.fromiter((subnet.difficulty for subnet in subnets), np.float64, count)
+        ).tolist()
+        emissions = (
+            np.fromiter((subnet.emission_value for subnet in subnets), np.float64, count)
+            / cybertensor.utils.GIGA
+            * 100
+        )
+        emission_strs = np.char.add(np.char.mod("%0.2f", emissions), "%").tolist()
+
+        for subnet, max_n_str, emission_str, difficulty_str in zip(
+            subnets, max_n_strs, emission_strs, difficulty_strs
+        ):
+            table.add_row(
+                str(subnet.netuid),
+                str(subnet.subnetwork_n),
+                max_n_str,
+                emission_str,
+                str(subnet.tempo),
+                f"{subnet.burn!s:8.8}",
+                difficulty_str,
+                # TODO revisit
+                # f"{delegate_info[subnet.owner_ss58].name if subnet.owner_ss58 in delegate_info else subnet.owner_ss58}",
+                subnet.owner,
+                subnet.metadata,
+            )
+        # Cells are pre-formatted, skip rich's per-cell repr highlighting.
+        console.print(table, highlight=False)
 
     @staticmethod
     def check_config(config: "Config"):
@@ -325,6 +330,7 @@ HYPERPARAMS = {
     "max_allowed_validators": "sudo_set_max_allowed_validators",
     "metadata": "sudo_set_subnet_metadata",
 }
+_HYPERPARAMS_CHOICES = tuple(HYPERPARAMS)
 
 
 class SubnetSudoCommand:
@@ -350,40 +356,44 @@ class SubnetSudoCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""Set subnet hyperparameters."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetSudoCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetSudoCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
 
-        wallet = Wallet(config=cli.config)
-        print("\n")
-        SubnetHyperparamsCommand.run(cli)
-        if not cli.config.is_set("param") and not cli.config.no_prompt:
-            param = Prompt.ask("Enter hyperparameter", choices=HYPERPARAMS)
-            cli.config.param = str(param)
-        if not cli.config.is_set("value") and not cli.config.no_prompt:
+        config = cli.config
+        no_prompt = config.no_prompt
+        param_set = config.is_set("param")
+        value_set = config.is_set("value")
+        wallet = Wallet(config=config)
+        # The current values are only shown as context for the prompts below.
+        if not param_set or not value_set:
+            print("\n")
+            SubnetHyperparamsCommand._run(cli, cwtensor)
+        if not param_set and not no_prompt:
+            param = Prompt.ask("Enter hyperparameter", choices=_HYPERPARAMS_CHOICES)
+            config.param = str(param)
+        if not value_set and not no_prompt:
             value = Prompt.ask("Enter new value")
-            cli.config.value = value
+            config.value = value
 
-        if (
-            cli.config.param == "network_registration_allowed"
-            or cli.config.param == "network_pow_registration_allowed"
-        ):
-            cli.config.value = True if cli.config.value.lower() == "true" else False
+        param = config.param
+        value = config.value
+        if param in ("network_registration_allowed", "network_pow_registration_allowed"):
+            value = True if value.lower() == "true" else False
+            config.value = value
 
-        cwtensor.set_hyperparameter(
+        netuid = config.netuid
+        success = cwtensor.set_hyperparameter(
             wallet,
-            netuid=cli.config.netuid,
-            parameter=cli.config.param,
-            value=cli.config.value,
-            prompt=not cli.config.no_prompt,
+            netuid=netuid,
+            parameter=param,
+            value=value,
+            prompt=not no_prompt,
         )
+        if success:
+            invalidate_subnet(cwtensor, netuid)
 
     @staticmethod
     def check_config(config: "Config"):
@@ -392,7 +402,7 @@ class SubnetSudoCommand:
             config.wallet.name = str(wallet_name)
 
         if not config.is_set("netuid") and not config.no_prompt:
-            check_netuid_set(config, cybertensor.cwtensor(config=config, log_verbose=False))
+            check_netuid_set(config, get_cwtensor(config))
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -403,8 +413,38 @@ class SubnetSudoCommand:
         parser.add_argument("--param", dest="param", type=str, required=False)
         parser.add_argument("--value", dest="value", type=str, required=False)
 
-        Wallet.add_args(parser)
-        cybertensor.cwtensor.add_args(parser)
+        defer_args(parser, Wallet.add_args, cybertensor.cwtensor.add_args)
+
+
+def _render_subnet_hyperparams(
+    cli: "cybertensor.cli",
+    cwtensor: "cybertensor.cwtensor",
+    *,
+    indent: str,
+    name_style: str,
+) -> None:
+    r"""Prints the hyperparameters table of ``cli.config.netuid``."""
+    subnet: cybertensor.SubnetHyperparameters = cached_subnet_query(
+        cwtensor, "get_subnet_hyperparameters", cli.config.netuid
+    )
+
+    table = Table(
+        show_footer=True,
+        width=cli.config.get("width", None),
+        pad_edge=True,
+        box=None,
+        show_edge=True,
+    )
+    table.title = "[white]Subnet Hyperparameters - NETUID: {} - {}".format(
+        cli.config.netuid, cwtensor.network
+    )
+    table.add_column("[overline white]HYPERPARAMETER", style=name_style)
+    table.add_column("[overline white]VALUE", style="green")
+
+    for param in subnet._fields:
+        table.add_row(indent + param, str(getattr(subnet, param)))
+
+    console.print(table)
 
 
 class SubnetHyperparamsCommand:
@@ -450,43 +490,19 @@ class SubnetHyperparamsCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""View hyperparameters of a subnetwork."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetHyperparamsCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetHyperparamsCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
-
-        subnet: cybertensor.SubnetHyperparameters = cwtensor.get_subnet_hyperparameters(
-            cli.config.netuid
+        _render_subnet_hyperparams(
+            cli, cwtensor, indent="  ", name_style="bold white"
         )
 
-        table = Table(
-            show_footer=True,
-            width=cli.config.get("width", None),
-            pad_edge=True,
-            box=None,
-            show_edge=True,
-        )
-        table.title = "[white]Subnet Hyperparameters - NETUID: {} - {}".format(
-            cli.config.netuid, cwtensor.network
-        )
-        table.add_column("[overline white]HYPERPARAMETER", style="bold white")
-        table.add_column("[overline white]VALUE", style="green")
-
-        for param in subnet.__dict__:
-            table.add_row("  " + param, str(subnet.__dict__[param]))
-
-        console.print(table)
-
     @staticmethod
     def check_config(config: "Config"):
         if not config.is_set("netuid") and not config.no_prompt:
-            check_netuid_set(config, cybertensor.cwtensor(config=config, log_verbose=False))
+            check_netuid_set(config, get_cwtensor(config))
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -548,42 +564,17 @@ class SubnetGetHyperparamsCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""View hyperparameters of a subnetwork."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetGetHyperparamsCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetGetHyperparamsCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
-        subnet: cybertensor.SubnetHyperparameters = cwtensor.get_subnet_hyperparameters(
-            cli.config.netuid
-        )
-
-        table = Table(
-            show_footer=True,
-            width=cli.config.get("width", None),
-            pad_edge=True,
-            box=None,
-            show_edge=True,
-        )
-        table.title = "[white]Subnet Hyperparameters - NETUID: {} - {}".format(
-            cli.config.netuid, cwtensor.network
-        )
-        table.add_column("[overline white]HYPERPARAMETER", style="white")
-        table.add_column("[overline white]VALUE", style="green")
-
-        for param in subnet.__dict__:
-            table.add_row(param, str(subnet.__dict__[param]))
-
-        console.print(table)
+        _render_subnet_hyperparams(cli, cwtensor, indent="", name_style="white")
 
     @staticmethod
     def check_config(config: "Config"):
         if not config.is_set("netuid") and not config.no_prompt:
-            check_netuid_set(config, cybertensor.cwtensor(config=config))
+            check_netuid_set(config, get_cwtensor(config))
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -615,52 +606,50 @@ class SubnetSetWeightsCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""Set weights for subnetwork."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetSetWeightsCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetSetWeightsCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
 
-        wallet = Wallet(config=cli.config)
+        config = cli.config
+        wallet = Wallet(config=config)
         # Get values if not set.
         example_uids = range(3)
-        if not cli.config.is_set("uids"):
+        if not config.is_set("uids"):
             example = ", ".join(map(str, example_uids)) + " ..."
-            cli.config.uids = Prompt.ask(f"Enter uids (e.g. {example})")
+            config.uids = Prompt.ask(f"Enter uids (e.g. {example})")
 
-        if not cli.config.is_set("weights"):
+        if not config.is_set("weights"):
             example = (
                 ", ".join(
                     map(str, ["{:.2f}".format(float(1 / len(example_uids))) for _ in example_uids])
                 )
                 + " ..."
             )
-            cli.config.weights = Prompt.ask(f"Enter weights (e.g. {example})")
+            config.weights = Prompt.ask(f"Enter weights (e.g. {example})")
 
-        # Parse from string
-        uids = torch.tensor(
-            list(map(int, re.split(r"[ ,]+", cli.config.uids))), dtype=torch.long
+        # Parse from string, separators may be commas and/or spaces.
+        uids = np.array(
+            list(map(int, config.uids.replace(",", " ").split())), dtype=np.int64
         )
-        weights = torch.tensor(
-            list(map(float, re.split(r"[ ,]+", cli.config.weights))),
-            dtype=torch.float32,
+        weights = np.array(
+            list(map(float, config.weights.replace(",", " ").split())),
+            dtype=np.float32,
         )
 
         # Run the set weights operation.
-        cwtensor.set_weights(
+        success, _ = cwtensor.set_weights(
             wallet=wallet,
-            netuid=cli.config.netuid,
+            netuid=config.netuid,
             uids=uids,
             weights=weights,
             version_key=0,
-            prompt=not cli.config.no_prompt,
+            prompt=not config.no_prompt,
             wait_for_finalization=True,
         )
+        if success:
+            invalidate_subnet(cwtensor, config.netuid)
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -670,8 +659,7 @@ class SubnetSetWeightsCommand:
         parser.add_argument(
             "--netuid", dest="netuid", type=int, required=False, default=False
         )
-        Wallet.add_args(parser)
-        cybertensor.cwtensor.add_args(parser)
+        defer_args(parser, Wallet.add_args, cybertensor.cwtensor.add_args)
 
     @staticmethod
     def check_config(config: "Config"):
@@ -684,7 +672,7 @@ class SubnetSetWeightsCommand:
             config.wallet.hotkey = str(hotkey)
 
         if not config.is_set("netuid") and not config.no_prompt:
-            check_netuid_set(config, cybertensor.cwtensor(config=config))
+            check_netuid_set(config, get_cwtensor(config))
 
 class SubnetGetWeightsCommand:
     """
@@ -723,18 +711,54 @@ class SubnetGetWeightsCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""Get weights for root network."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            SubnetGetWeightsCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        SubnetGetWeightsCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
 
-        weights = cwtensor.weights(cli.config.netuid)
+        weights = cached_subnet_query(cwtensor, "weights", cli.config.netuid)
+
+        # TODO refactor netuids to uids, copy-pasted from root command code, need refactoring with attention to naming
+        # Rows are the sorted uids, including those that have not set any weights.
+        uids = np.unique(np.asarray([uid for uid, _ in weights], dtype=np.int64))
+        netuids: List[int] = []
+        # Dense (uid, netuid) matrix of normalized weights, NaN where a uid set no weight.
+        weights_matrix = np.full((len(uids), 0), np.nan)
+        # Flatten every (uid, netuid, weight) triple so normalization is a single vectorized pass.
+        triples = [
+            (uid, netuid, weight)
+            for uid, weights_data in weights
+            for netuid, weight in weights_data
+        ]
+        if triples:
+            triples_arr = np.asarray(triples, dtype=np.float64)
+            uid_index = np.searchsorted(uids, triples_arr[:, 0].astype(np.int64))
+            netuids_arr = triples_arr[:, 1].astype(np.int64)
+            weights_arr = triples_arr[:, 2]
+
+            denom = np.bincount(uid_index, weights=weights_arr, minlength=len(uids))[
+                uid_index
+            ]
+            # A uid whose weights sum to zero keeps zero weights rather than dividing by zero.
+            normalized = np.divide(
+                weights_arr,
+                denom,
+                out=np.zeros_like(weights_arr),
+                where=denom > 0,
+            )
+
+            # Columns are the sorted netuids.
+            unique_netuids, netuid_index = np.unique(netuids_arr, return_inverse=True)
+            netuids = unique_netuids.tolist()
+            weights_matrix = np.full((len(uids), len(netuids)), np.nan)
+            weights_matrix[uid_index, netuid_index] = normalized
+
+        weight_strs = np.where(
+            np.isnan(weights_matrix),
+            "-",
+            np.char.mod("%0.2f%%", weights_matrix * 100),
+        )
 
         table = Table(show_footer=False)
         table.title = "[white]Subnet Operators Weights"
@@ -745,29 +769,6 @@ class SubnetGetWeightsCommand:
             style="rgb(50,163,219)",
             no_wrap=True,
         )
-
-        # TODO refactor netuids to uids, copy-pasted from root command code, need refactoring with attention to naming
-        uid_to_weights = {}
-        netuids = set()
-        for matrix in weights:
-            [uid, weights_data] = matrix
-
-            if not len(weights_data):
-                uid_to_weights[uid] = {}
-                normalized_weights = []
-            else:
-                normalized_weights = np.array(weights_data)[:, 1] / max(
-                    np.sum(weights_data, axis=0)[1], 1
-                )
-
-            for weight_data, normalized_weight in zip(weights_data, normalized_weights):
-                [netuid, _] = weight_data
-                netuids.add(netuid)
-                if uid not in uid_to_weights:
-                    uid_to_weights[uid] = {}
-
-                uid_to_weights[uid][netuid] = normalized_weight
-
         for netuid in netuids:
             table.add_column(
                 f"[white]{netuid}",
@@ -778,24 +779,15 @@ class SubnetGetWeightsCommand:
                 no_wrap=True,
             )
 
-        for uid in uid_to_weights:
-            row = [str(uid)]
-
-            uid_weights = uid_to_weights[uid]
-            for netuid in netuids:
-                if netuid in uid_weights:
-                    normalized_weight = uid_weights[netuid]
-                    row.append("{:0.2f}%".format(normalized_weight * 100))
-                else:
-                    row.append("-")
-            table.add_row(*row)
+        for uid, uid_weight_strs in zip(uids.tolist(), weight_strs.tolist()):
+            table.add_row(str(uid), *uid_weight_strs)
 
         table.show_footer = True
 
         table.box = None
         table.pad_edge = False
         table.width = None
-        console.print(table)
+        console.print(table, highlight=False)
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -805,10 +797,9 @@ class SubnetGetWeightsCommand:
         parser.add_argument(
             "--netuid", dest="netuid", type=int, required=False, default=False
         )
-        Wallet.add_args(parser)
-        cybertensor.cwtensor.add_args(parser)
+        defer_args(parser, Wallet.add_args, cybertensor.cwtensor.add_args)
 
     @staticmethod
     def check_config(config: "Config"):
         if not config.is_set("netuid") and not config.no_prompt:
-            check_netuid_set(config, cybertensor.cwtensor(config=config))
+            check_netuid_set(config, get_cwtensor(config))
@@ -17,10 +17,14 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
-from collections import defaultdict
+import contextlib
+import difflib
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import List, Optional, Dict, Tuple
 
-from fuzzywuzzy import fuzz
+import numpy as np
 from rich.align import Align
 from rich.prompt import Prompt
 from rich.table import Table
@@ -40,6 +44,72 @@ from cybertensor.utils.balance import Balance
 from cybertensor.wallet import Wallet
 
 
+# Overview table columns as (header, style, justify, no_wrap, footer, footer only under the last subnet).
+OVERVIEW_COLUMNS = (
+    ("COLDKEY", "bold white", "left", False, "neurons", True),
+    ("HOTKEY", "white", "left", False, "neurons", True),
+    ("UID", "yellow", "left", False, "neurons", False),
+    ("ACTIVE", "green", "right", True, None, False),
+    ("STAKE({symbol})", "green", "right", True, "stake", True),
+    ("RANK", "green", "right", True, "rank", False),
+    ("TRUST", "green", "right", True, "trust", False),
+    ("CONSENSUS", "green", "right", True, "consensus", False),
+    ("INCENTIVE", "green", "right", True, "incentive", False),
+    ("DIVIDENDS", "green", "right", True, "dividends", False),
+    ("EMISSION({symbol})", "green", "right", True, "emission", False),
+    ("VTRUST", "green", "right", True, "validator_trust", False),
+    ("VPERMIT", None, "right", True, None, False),
+    ("UPDATED", None, "right", True, None, False),
+    ("AXON", "dim blue", "left", True, None, False),
+    ("HOTKEY", "dim blue", "left", False, None, False),
+)
+
+
+def _build_header_index() -> Dict[str, int]:
+    r"""Maps each lowercased ``OVERVIEW_COLUMNS`` header, without the token symbol, to its first column index."""
+    header_index: Dict[str, int] = {}
+    for index, (header, *_) in enumerate(OVERVIEW_COLUMNS):
+        header_index.setdefault(header.replace("({symbol})", "").lower(), index)
+    return header_index
+
+
+# Overview table column indices, by lowercased header without the token symbol.
+HEADER_INDEX = _build_header_index()
+
+
+# Stands in for a wallet when the chain pairs a hotkey with a coldkey we do not hold locally.
+_Mismatch = namedtuple("_Mismatch", ["name", "hotkey_str"])
+
+
+def _get_sort_column(sort_by: str) -> int:
+    r"""Returns the index of the column best matching ``sort_by``: an exact header, then a header prefix,
+    then the closest header. Warns and defaults to the first column if none match."""
+    sort_by = sort_by.lower()
+    index = HEADER_INDEX.get(sort_by)
+    if index is not None:
+        return index
+
+    for header, index in HEADER_INDEX.items():
+        if header.startswith(sort_by):
+            return index
+
+    matches = difflib.get_close_matches(sort_by, HEADER_INDEX, n=1, cutoff=0.6)
+    if matches:
+        return HEADER_INDEX[matches[0]]
+
+    console.print(
+        f":warning:[yellow]No column matches sort_by '{sort_by}', sorting by {OVERVIEW_COLUMNS[0][0]}[/yellow]"
+    )
+    return 0
+
+
+def _field_array(
+    neurons: List["cybertensor.NeuronInfoLite"], field: str, dtype=np.float64
+) -> np.ndarray:
+    r"""Returns the ``field`` of every neuron as a single array."""
+    return np.fromiter(map(attrgetter(field), neurons), dtype=dtype, count=len(neurons))
+
+
 class OverviewCommand:
     """
     Executes the 'overview' command to present a detailed overview of the user's registered accounts on the cybertensor network.
@@ -99,14 +169,21 @@ class OverviewCommand:
         # We are printing for every coldkey.
         if cli.config.get("all", d=None):
             cold_wallets = get_coldkey_wallets_for_path(cli.config.wallet.path)
-            for cold_wallet in tqdm(cold_wallets, desc="Pulling balances"):
-                if (
-                    cold_wallet.coldkeypub_file.exists_on_device()
-                    and not cold_wallet.coldkeypub_file.is_encrypted()
-                ):
-                    total_balance = total_balance + cwtensor.get_balance(
-                        cold_wallet.coldkeypub.address
+            coldkey_addresses = [
+                cold_wallet.coldkeypub.address
+                for cold_wallet in cold_wallets
+                if cold_wallet.coldkeypub_file.exists_on_device()
+                and not cold_wallet.coldkeypub_file.is_encrypted()
+            ]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                balances = list(
+                    tqdm(
+                        executor.map(cwtensor.get_balance, coldkey_addresses),
+                        total=len(coldkey_addresses),
+                        desc="Pulling balances",
                     )
+                )
+            total_balance = sum(balances, Balance(0))
             all_hotkeys = get_all_wallets_for_path(cli.config.wallet.path)
         else:
             # We are only printing keys for a single coldkey
@@ -152,51 +229,71 @@ class OverviewCommand:
 
         netuids = cwtensor.get_all_subnet_netuids()
         netuids = filter_netuids_by_registered_hotkeys(
-            cli, cwtensor, netuids, all_hotkeys
+            cli, cwtensor, netuids, all_hotkeys, block=block
         )
         cybertensor.logging.debug(f"Netuids to check: {netuids}")
 
         for netuid in netuids:
             neurons[str(netuid)] = []
 
-        all_wallet_names = set([wallet.name for wallet in all_hotkeys])
-        all_coldkey_wallets = [
-            Wallet(name=wallet_name, path=cli.config.wallet.path) for wallet_name in all_wallet_names
-        ]
-
-        hotkey_coldkey_to_hotkey_wallet = {}
+        # One wallet per coldkey name, reusing the hotkey wallets whose coldkeypub is already loaded.
+        coldkey_wallet_by_name: Dict[str, "Wallet"] = {}
         for hotkey_wallet in all_hotkeys:
-            if hotkey_wallet.hotkey.address not in hotkey_coldkey_to_hotkey_wallet:
-                hotkey_coldkey_to_hotkey_wallet[hotkey_wallet.hotkey.address] = {}
-
-            hotkey_coldkey_to_hotkey_wallet[hotkey_wallet.hotkey.address][
-                hotkey_wallet.coldkeypub.address
-            ] = hotkey_wallet
-
-        all_hotkey_addresses = list(hotkey_coldkey_to_hotkey_wallet.keys())
-        with console.status(
-            ":satellite: Syncing with chain: [white]{}[/white] ...".format(
-                cli.config.cwtensor.get(
-                    "network", defaults.cwtensor.network
+            coldkey_wallet_by_name.setdefault(hotkey_wallet.name, hotkey_wallet)
+        all_coldkey_wallets = list(coldkey_wallet_by_name.values())
+
+        wallet_by_pair: Dict[Tuple[str, str], "Wallet"] = {
+            (hotkey_wallet.hotkey.address, hotkey_wallet.coldkeypub.address): hotkey_wallet
+            for hotkey_wallet in all_hotkeys
+        }
+
+        all_hotkey_addresses = list(dict.fromkeys(hotkey for hotkey, _ in wallet_by_pair))
+        # The live spinner is only worth rendering on an interactive terminal.
+        sync_status = (
+            console.status(
+                ":satellite: Syncing with chain: [white]{}[/white] ...".format(
+                    cli.config.cwtensor.get(
+                        "network", defaults.cwtensor.network
+                    )
                 )
             )
-        ):
+            if console.is_terminal
+            else contextlib.nullcontext()
+        )
+        with sync_status:
 
             # Pull neuron info for all keys.
             ## Max len(netuids) or 5 threads.
 
-            for netuid in netuids[:max_len_netuids]:
-                netuid, neurons_result, err_msg = \
-                    OverviewCommand._get_neurons_for_netuid((cli.config, netuid, all_hotkey_addresses))
+            netuids_to_check = netuids[:max_len_netuids]
+            with ThreadPoolExecutor(max_workers=max(len(netuids_to_check), 1)) as executor:
+                results = list(
+                    executor.map(
+                        OverviewCommand._get_neurons_for_netuid,
+                        [(cli.config, netuid, all_hotkey_addresses) for netuid in netuids_to_check],
+                    )
+                )
+
+            empty_netuids = set()
+            for netuid, neurons_result, err_msg in results:
                 if err_msg is not None:
                     console.print(f"netuid '{netuid}': {err_msg}")
                 if len(neurons_result) == 0:
                     # Remove netuid from overview if no neurons are found.
-                    netuids.remove(netuid)
+                    empty_netuids.add(netuid)
                     del neurons[str(netuid)]
                 else:
                     # Add neurons to overview.
                     neurons[str(netuid)] = neurons_result
+            if empty_netuids:
+                netuids = [netuid for netuid in netuids if netuid not in empty_netuids]
+
+            # Prefetch tempos of the subnets that will be rendered so rendering makes no further queries.
+            tempo_netuids = [netuid for netuid in netuids if neurons.get(str(netuid))]
+            with ThreadPoolExecutor(max_workers=max(min(len(tempo_netuids), 8), 1)) as executor:
+                tempos = dict(
+                    zip(tempo_netuids, executor.map(cwtensor.tempo, tempo_netuids))
+                )
 
             total_coldkey_stake_from_metagraph = defaultdict(
                 lambda: Balance(0.0)
@@ -214,14 +311,14 @@ class OverviewCommand:
             alerts_table = Table(show_header=True, header_style="bold magenta")
             alerts_table.add_column("🥩 alert!")
 
+            total_coldkey_stake_from_chain = cwtensor.get_total_stake_for_coldkeys(
+                [coldkey_wallet.coldkeypub.address for coldkey_wallet in all_coldkey_wallets]
+            )
             coldkeys_to_check = []
             for coldkey_wallet in all_coldkey_wallets:
                 # Check if we have any stake with hotkeys that are not registered.
-                total_coldkey_stake_from_chain = cwtensor.get_total_stake_for_coldkey(
-                    address=coldkey_wallet.coldkeypub.address
-                )
                 difference = (
-                    total_coldkey_stake_from_chain
+                    total_coldkey_stake_from_chain[coldkey_wallet.coldkeypub.address]
                     - total_coldkey_stake_from_metagraph[
                         coldkey_wallet.coldkeypub.address
                     ]
@@ -241,11 +338,37 @@ class OverviewCommand:
                 if "-1" not in neurons:
                     neurons["-1"] = []
 
-            for coldkey_wallet in coldkeys_to_check:
-                coldkey_wallet, de_registered_stake, err_msg = \
-                    OverviewCommand._get_de_registered_stake_for_coldkey_wallet(
-                        (cli.config, all_hotkey_addresses, coldkey_wallet))
+            # Fetched once up front rather than once per staked hotkey of every coldkey.
+            delegate_hotkeys = set()
+            delegates_err_msg = None
+            if coldkeys_to_check:
+                try:
+                    delegate_hotkeys = {
+                        delegate.hotkey for delegate in cwtensor.get_delegates()
+                    }
+                except Exception as e:
+                    delegates_err_msg = "Error: {}".format(e)
+
+            if delegates_err_msg is not None:
+                # Delegate stake can not be told apart, report the error for each coldkey instead.
+                results = [
+                    (coldkey_wallet, [], delegates_err_msg)
+                    for coldkey_wallet in coldkeys_to_check
+                ]
+            else:
+                all_hotkey_addresses_set = set(all_hotkey_addresses)
+                with ThreadPoolExecutor(max_workers=max(min(len(coldkeys_to_check), 8), 1)) as executor:
+                    results = list(
+                        executor.map(
+                            OverviewCommand._get_de_registered_stake_for_coldkey_wallet,
+                            [
+                                (cli.config, all_hotkey_addresses_set, delegate_hotkeys, coldkey_wallet)
+                                for coldkey_wallet in coldkeys_to_check
+                            ],
+                        )
+                    )
 
+            for coldkey_wallet, de_registered_stake, err_msg in results:
                 if err_msg is not None:
                     console.print(err_msg)
 
@@ -271,11 +394,7 @@ class OverviewCommand:
                     wallet_.hotkey = hotkey_addr
                     wallet.hotkey_str = hotkey_addr[:max_len_keys]  # Max length of 5 characters
                     # Indicates a hotkey not on local machine but exists in stake_info obj on-chain
-                    if hotkey_coldkey_to_hotkey_wallet.get(hotkey_addr) is None:
-                        hotkey_coldkey_to_hotkey_wallet[hotkey_addr] = {}
-                    hotkey_coldkey_to_hotkey_wallet[hotkey_addr][
-                        coldkey_wallet.coldkeypub.address
-                    ] = wallet_
+                    wallet_by_pair[(hotkey_addr, coldkey_wallet.coldkeypub.address)] = wallet_
 
                 # Add neurons to overview.
                 neurons["-1"].extend(de_registered_neurons)
@@ -298,254 +417,159 @@ class OverviewCommand:
         # Add title
         grid.add_row(Align(title, vertical="middle", align="center"))
 
-        # Generate rows per netuid
+        # Print the alerts and title, then each subnet table as soon as it is built.
+        width = cli.config.get("width", None)
+        if console.is_terminal:
+            console.clear()
+        console.print(grid, width=width)
+
+        # Generate rows per netuid, skipping subnets without any of our neurons so the
+        # last rendered subnet still carries the footer.
+        netuids = [netuid for netuid in netuids if neurons.get(str(netuid))]
         hotkeys_seen = set()
         total_neurons = 0
         total_stake = 0.0
         for netuid in netuids:
-            subnet_tempo = cwtensor.tempo(netuid=netuid)
+            subnet_tempo = tempos[netuid]
             last_subnet = netuid == netuids[-1]
-            TABLE_DATA = []
-            total_rank = 0.0
-            total_trust = 0.0
-            total_consensus = 0.0
-            total_validator_trust = 0.0
-            total_incentive = 0.0
-            total_dividends = 0.0
-            total_emission = 0
-
-            for nn in neurons[str(netuid)]:
-                hotwallet = hotkey_coldkey_to_hotkey_wallet.get(nn.hotkey, {}).get(
-                    nn.coldkey, None
+            subnet_neurons = neurons[str(netuid)]
+            emissions = (
+                _field_array(subnet_neurons, "emission") / (subnet_tempo + 1) * 1e9
+            ).astype(np.int64)
+            last_updates = block - _field_array(
+                subnet_neurons, "last_update", dtype=np.int64
+            )
+            rows_and_keys = [
+                OverviewCommand._get_neuron_row(
+                    nn, wallet_by_pair, emission, last_update
                 )
-                if not hotwallet:
-                    # Indicates a mismatch between what the chain says the coldkey
-                    # is for this hotkey and the local wallet coldkey-hotkey pair
-                    hotwallet = argparse.Namespace()
-                    hotwallet.name = nn.coldkey[:7]
-                    hotwallet.hotkey_str = nn.hotkey[:7]
-                nn: cybertensor.NeuronInfoLite
-                uid = nn.uid
-                active = nn.active
-                stake = nn.total_stake.gboot
-                rank = nn.rank
-                trust = nn.trust
-                consensus = nn.consensus
-                validator_trust = nn.validator_trust
-                incentive = nn.incentive
-                dividends = nn.dividends
-                emission = int(nn.emission / (subnet_tempo + 1) * 1e9)
-                last_update = int(block - nn.last_update)
-                validator_permit = nn.validator_permit
-                row = [
-                    hotwallet.name,
-                    hotwallet.hotkey_str,
-                    str(uid),
-                    str(active),
-                    "{:.5f}".format(stake),
-                    "{:.5f}".format(rank),
-                    "{:.5f}".format(trust),
-                    "{:.5f}".format(consensus),
-                    "{:.5f}".format(incentive),
-                    "{:.5f}".format(dividends),
-                    "{:_}".format(emission),
-                    "{:.5f}".format(validator_trust),
-                    "*" if validator_permit else "",
-                    str(last_update),
-                    (
-                        cybertensor.utils.networking.int_to_ip(nn.axon_info.ip)
-                        + ":"
-                        + str(nn.axon_info.port)
-                        if nn.axon_info.port != 0
-                        else "[yellow]none[/yellow]"
-                    ),
-                    nn.hotkey,
-                ]
-
-                total_rank += rank
-                total_trust += trust
-                total_consensus += consensus
-                total_incentive += incentive
-                total_dividends += dividends
-                total_emission += emission
-                total_validator_trust += validator_trust
-
+                for nn, emission, last_update in zip(
+                    subnet_neurons, emissions.tolist(), last_updates.tolist()
+                )
+            ]
+            total_rank = _field_array(subnet_neurons, "rank").sum()
+            total_trust = _field_array(subnet_neurons, "trust").sum()
+            total_consensus = _field_array(subnet_neurons, "consensus").sum()
+            total_validator_trust = _field_array(subnet_neurons, "validator_trust").sum()
+            total_incentive = _field_array(subnet_neurons, "incentive").sum()
+            total_dividends = _field_array(subnet_neurons, "dividends").sum()
+            total_emission = emissions.sum()
+
+            for nn in subnet_neurons:
                 if not (nn.hotkey, nn.coldkey) in hotkeys_seen:
                     # Don't double count stake on hotkey-coldkey pairs.
                     hotkeys_seen.add((nn.hotkey, nn.coldkey))
-                    total_stake += stake
-
-                # netuid -1 are neurons that are de-registered.
-                if netuid != "-1":
-                    total_neurons += 1
+                    total_stake += nn.total_stake.gboot
 
-                TABLE_DATA.append(row)
+            # netuid -1 are neurons that are de-registered.
+            if netuid != "-1":
+                total_neurons += len(subnet_neurons)
 
             # Add subnet header
             if netuid == "-1":
-                grid.add_row(f"Deregistered Neurons")
+                console.print(f"Deregistered Neurons", width=width)
             else:
-                grid.add_row(f"Subnet: [bold white]{netuid}[/bold white]")
+                console.print(f"Subnet: [bold white]{netuid}[/bold white]", width=width)
 
             table = Table(
                 show_footer=False,
-                width=cli.config.get("width", None),
+                width=width,
                 pad_edge=False,
                 box=None,
             )
-            if last_subnet:
-                table.add_column(
-                    "[overline white]COLDKEY",
-                    str(total_neurons),
-                    footer_style="overline white",
-                    style="bold white",
-                )
-                table.add_column(
-                    "[overline white]HOTKEY",
-                    str(total_neurons),
-                    footer_style="overline white",
-                    style="white",
-                )
-            else:
-                # No footer for non-last subnet.
-                table.add_column("[overline white]COLDKEY", style="bold white")
-                table.add_column("[overline white]HOTKEY", style="white")
-            table.add_column(
-                "[overline white]UID",
-                str(total_neurons),
-                footer_style="overline white",
-                style="yellow",
-            )
-            table.add_column(
-                "[overline white]ACTIVE", justify="right", style="green", no_wrap=True
-            )
-            if last_subnet:
-                table.add_column(
-                    f"[overline white]STAKE({cwtensor.giga_token_symbol})",
-                    f"{cwtensor.giga_token_symbol}{total_stake:.5f}",
-                    footer_style="overline white",
-                    justify="right",
-                    style="green",
-                    no_wrap=True,
-                )
-            else:
-                # No footer for non-last subnet.
-                table.add_column(
-                    f"[overline white]STAKE({cwtensor.giga_token_symbol})",
-                    justify="right",
-                    style="green",
-                    no_wrap=True,
-                )
-            table.add_column(
-                "[overline white]RANK",
-                f"{total_rank:.5f}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column(
-                "[overline white]TRUST",
-                f"{total_trust:.5f}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column(
-                "[overline white]CONSENSUS",
-                f"{total_consensus:.5f}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column(
-                "[overline white]INCENTIVE",
-                f"{total_incentive:.5f}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column(
-                "[overline white]DIVIDENDS",
-                f"{total_dividends:.5f}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column(
-                f"[overline white]EMISSION({cwtensor.giga_token_symbol})",
-                f"{cwtensor.giga_token_symbol}{total_emission:_}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column(
-                "[overline white]VTRUST",
-                f"{total_validator_trust:.5f}",
-                footer_style="overline white",
-                justify="right",
-                style="green",
-                no_wrap=True,
-            )
-            table.add_column("[overline white]VPERMIT", justify="right", no_wrap=True)
-            table.add_column("[overline white]UPDATED", justify="right", no_wrap=True)
-            table.add_column(
-                "[overline white]AXON", justify="left", style="dim blue", no_wrap=True
-            )
-            table.add_column(
-                "[overline white]HOTKEY", style="dim blue", no_wrap=False
-            )
+            footers = {
+                "neurons": str(total_neurons),
+                "stake": f"{cwtensor.giga_token_symbol}{total_stake:.5f}",
+                "rank": f"{total_rank:.5f}",
+                "trust": f"{total_trust:.5f}",
+                "consensus": f"{total_consensus:.5f}",
+                "incentive": f"{total_incentive:.5f}",
+                "dividends": f"{total_dividends:.5f}",
+                "emission": f"{cwtensor.giga_token_symbol}{total_emission:_}",
+                "validator_trust": f"{total_validator_trust:.5f}",
+            }
+            for header, style, justify, no_wrap, footer, last_only in OVERVIEW_COLUMNS:
+                header = "[overline white]" + header.format(symbol=cwtensor.giga_token_symbol)
+                if footer is None or (last_only and not last_subnet):
+                    table.add_column(header, style=style, justify=justify, no_wrap=no_wrap)
+                else:
+                    table.add_column(
+                        header,
+                        footers[footer],
+                        footer_style="overline white",
+                        style=style,
+                        justify=justify,
+                        no_wrap=no_wrap,
+                    )
             table.show_footer = True
 
             sort_by: Optional[str] = cli.config.get("sort_by", None)
             sort_order: Optional[str] = cli.config.get("sort_order", None)
 
             if sort_by is not None and sort_by != "":
-                column_to_sort_by: int = 0
-                highest_matching_ratio: int = 0
+                column_to_sort_by: int = _get_sort_column(sort_by)
                 sort_descending: bool = False  # Default sort_order to ascending
 
-                for index, column in zip(range(len(table.columns)), table.columns):
-                    # Fuzzy match the column name. Default to the first column.
-                    column_name = column.header.lower().replace("[overline white]", "")
-                    match_ratio = fuzz.ratio(sort_by.lower(), column_name)
-                    # Finds the best matching column
-                    if match_ratio > highest_matching_ratio:
-                        highest_matching_ratio = match_ratio
-                        column_to_sort_by = index
-
                 if sort_order.lower() in {"desc", "descending", "reverse"}:
                     # Sort descending if the sort_order matches desc, descending, or reverse
                     sort_descending = True
 
-                def overview_sort_function(row):
-                    data = row[column_to_sort_by]
-                    # Try to convert to number if possible
-                    try:
-                        data = float(data)
-                    except ValueError:
-                        pass
-                    return data
-
-                TABLE_DATA.sort(key=overview_sort_function, reverse=sort_descending)
+                rows_and_keys.sort(
+                    key=lambda row_and_keys: row_and_keys[1][column_to_sort_by],
+                    reverse=sort_descending,
+                )
 
-            for row in TABLE_DATA:
+            for row, _ in rows_and_keys:
                 table.add_row(*row)
 
-            grid.add_row(table)
-
-        console.clear()
+            console.print(table, width=width)
 
         caption = f"[italic][dim][white]Wallet balance: [green]{cwtensor.giga_token_symbol}{total_balance.gboot}"
-        grid.add_row(Align(caption, vertical="middle", align="center"))
+        console.print(Align(caption, vertical="middle", align="center"), width=width)
 
-        # Print the entire table/grid
-        console.print(grid, width=cli.config.get("width", None))
+    @staticmethod
+    def _get_neuron_row(
+        nn: "cybertensor.NeuronInfoLite",
+        wallet_by_pair: Dict[Tuple[str, str], "Wallet"],
+        emission: int,
+        last_update: int,
+    ) -> Tuple[List[str], list]:
+        r"""Returns the overview table row for a neuron along with the raw value behind each cell to sort by."""
+        hotwallet = wallet_by_pair.get((nn.hotkey, nn.coldkey))
+        if not hotwallet:
+            # Indicates a mismatch between what the chain says the coldkey
+            # is for this hotkey and the local wallet coldkey-hotkey pair
+            hotwallet = _Mismatch(nn.coldkey[:7], nn.hotkey[:7])
+        vpermit = "*" if nn.validator_permit else ""
+        axon = (
+            cybertensor.utils.networking.int_to_ip(nn.axon_info.ip)
+            + ":"
+            + str(nn.axon_info.port)
+            if nn.axon_info.port != 0
+            else "[yellow]none[/yellow]"
+        )
+        # (cell, sort key) for each of OVERVIEW_COLUMNS, in order.
+        cells = [
+            (hotwallet.name, hotwallet.name),
+            (hotwallet.hotkey_str, hotwallet.hotkey_str),
+            (str(nn.uid), nn.uid),
+            (str(nn.active), str(nn.active)),
+            ("{:.5f}".format(nn.total_stake.gboot), nn.total_stake.gboot),
+            ("{:.5f}".format(nn.rank), nn.rank),
+            ("{:.5f}".format(nn.trust), nn.trust),
+            ("{:.5f}".format(nn.consensus), nn.consensus),
+            ("{:.5f}".format(nn.incentive), nn.incentive),
+            ("{:.5f}".format(nn.dividends), nn.dividends),
+            ("{:_}".format(emission), emission),
+            ("{:.5f}".format(nn.validator_trust), nn.validator_trust),
+            (vpermit, vpermit),
+            (str(last_update), last_update),
+            (axon, axon),
+            (nn.hotkey, nn.hotkey),
+        ]
+        row = [cell for cell, _ in cells]
+        sort_keys = [key for _, key in cells]
+        return row, sort_keys
 
     @staticmethod
     def _get_neurons_for_netuid(
@@ -583,7 +607,7 @@ class OverviewCommand:
     ) -> Tuple[
         "Wallet", List[Tuple[str, "Balance"]], Optional[str]
     ]:
-        cwtensor_config, all_hotkey_addresses, coldkey_wallet = args_tuple
+        cwtensor_config, all_hotkey_addresses, delegate_hotkeys, coldkey_wallet = args_tuple
 
         # List of (hotkey_addr, our_stake) tuples.
         result: List[Tuple[str, "Balance"]] = []
@@ -603,7 +627,7 @@ class OverviewCommand:
                     return False  # Skip hotkeys that we have no stake with.
                 if stake_info.hotkey in all_hotkey_addresses:
                     return False  # Skip hotkeys that are in our wallets.
-                if cwtensor.is_hotkey_delegate(hotkey=stake_info.hotkey):
+                if stake_info.hotkey in delegate_hotkeys:
                     return False  # Skip hotkeys that are delegates, they show up in ctcli my_delegates table.
 
                 return True
@@ -18,6 +18,7 @@
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 from rich.prompt import Prompt, Confirm
@@ -25,7 +26,14 @@ from rich.prompt import Prompt, Confirm
 import cybertensor
 from cybertensor import __console__ as console
 from cybertensor.commands import defaults
-from cybertensor.commands.utils import check_netuid_set, check_for_cuda_reg_config
+from cybertensor.commands.utils import (
+    cached_subnet_query,
+    check_netuid_set,
+    check_for_cuda_reg_config,
+    get_cwtensor,
+    invalidate_hotkey_netuids,
+    invalidate_subnet,
+)
 from cybertensor.config import Config
 from cybertensor.wallet import Wallet
 
@@ -63,29 +71,35 @@ class RegisterCommand:
     @staticmethod
     def run(cli: "cybertensor.cli"):
         r"""Register neuron by recycling some GBOOT."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            RegisterCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        RegisterCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
 
         wallet = Wallet(config=cli.config)
 
+        # The subnet, recycle and balance queries are independent, issue them together.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            subnet_exists_future = executor.submit(
+                cached_subnet_query, cwtensor, "subnet_exists", cli.config.netuid
+            )
+            # Queried live, it is the amount burned_register will charge.
+            recycle_future = executor.submit(cwtensor.recycle, cli.config.netuid)
+            balance_future = executor.submit(
+                cwtensor.get_balance, wallet.coldkeypub.address
+            )
+
         # Verify subnet exists
-        if not cwtensor.subnet_exists(netuid=cli.config.netuid):
+        if not subnet_exists_future.result():
             console.print(
                 f"[red]Subnet {cli.config.netuid} does not exist[/red]"
             )
             sys.exit(1)
 
         # Check current recycle amount
-        current_recycle = cwtensor.recycle(netuid=cli.config.netuid)
-        balance = cwtensor.get_balance(wallet.coldkeypub.address)
+        current_recycle = recycle_future.result()
+        balance = balance_future.result()
 
         # Check balance is sufficient
         if balance < current_recycle:
@@ -106,13 +120,15 @@ class RegisterCommand:
             ):
                 sys.exit(1)
 
-        cwtensor.burned_register(
+        if cwtensor.burned_register(
             wallet=wallet, netuid=cli.config.netuid, prompt=not cli.config.no_prompt
-        )
+        ):
+            invalidate_subnet(cwtensor, cli.config.netuid)
+            invalidate_hotkey_netuids(cwtensor, wallet.hotkey.address)
 
     @classmethod
     def check_config(cls, config: "Config"):
-        check_netuid_set(config, cwtensor=cybertensor.cwtensor(config=config, log_verbose=False))
+        check_netuid_set(config, cwtensor=get_cwtensor(config))
 
         if not config.is_set("wallet.name") and not config.no_prompt:
             wallet_name = Prompt.ask("Enter wallet name", default=defaults.wallet.name)
@@ -175,13 +191,8 @@ class PowRegisterCommand:
     @staticmethod
     def run(cli: "cybertensor.cli") -> None:
         r"""Register neuron."""
-        try:
-            cwtensor = cybertensor.cwtensor(config=cli.config, log_verbose=False)
-            PowRegisterCommand._run(cli, cwtensor)
-        finally:
-            if "cwtensor" in locals():
-                cwtensor.close()
-                cybertensor.logging.debug("closing cwtensor connection")
+        cwtensor = get_cwtensor(cli.config)
+        PowRegisterCommand._run(cli, cwtensor)
 
     @staticmethod
     def _run(cli: "cybertensor.cli", cwtensor: "cybertensor.cwtensor"):
@@ -189,13 +200,13 @@ class PowRegisterCommand:
         wallet = Wallet(config=cli.config)
 
         # Verify subnet exists
-        if not cwtensor.subnet_exists(netuid=cli.config.netuid):
+        if not cached_subnet_query(cwtensor, "subnet_exists", cli.config.netuid):
             console.print(
                 f"[red]Subnet {cli.config.netuid} does not exist[/red]"
             )
             sys.exit(1)
 
-        cwtensor.register(
+        if cwtensor.register(
             wallet=wallet,
             netuid=cli.config.netuid,
             prompt=not cli.config.no_prompt,
@@ -212,7 +223,9 @@ class PowRegisterCommand:
             log_verbose=cli.config.pow_register.get(
                 "verbose", defaults.pow_register.verbose
             ),
-        )
+        ):
+            invalidate_subnet(cwtensor, cli.config.netuid)
+            invalidate_hotkey_netuids(cwtensor, wallet.hotkey.address)
 
     @staticmethod
     def add_args(parser: argparse.ArgumentParser):
@@ -319,7 +332,7 @@ class PowRegisterCommand:
         #     config.cwtensor.network_config = network_config
         #     config.cwtensor.contract_address = contract_address
 
-        check_netuid_set(config, cwtensor=cybertensor.cwtensor(config=config))  # , log_verbose=False)
+        check_netuid_set(config, cwtensor=get_cwtensor(config))
 
         if not config.is_set("wallet.name") and not config.no_prompt:
             wallet_name = Prompt.ask("Enter wallet name", default=defaults.wallet.name)
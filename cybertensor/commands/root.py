@@ -17,7 +17,6 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
-import re
 import typing
 from typing import List, Optional, Dict
 
@@ -520,12 +519,13 @@ class RootSetWeightsCommand:
             )
             cli.config.weights = Prompt.ask(f"Enter weights (e.g. {example})")
 
-        # Parse from string
+        # Parse from string, separators may be commas and/or spaces.
         netuids = torch.tensor(
-            list(map(int, re.split(r"[ ,]+", cli.config.netuids))), dtype=torch.long
+            list(map(int, cli.config.netuids.replace(",", " ").split())),
+            dtype=torch.long,
         )
         weights = torch.tensor(
-            list(map(float, re.split(r"[ ,]+", cli.config.weights))),
+            list(map(float, cli.config.weights.replace(",", " ").split())),
             dtype=torch.float32,
         )
 
@@ -16,10 +16,16 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import argparse
+import atexit
+import json
 import os
+import pickle
 import sys
+import tempfile
+import time
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 import requests
 import torch
@@ -47,6 +53,136 @@ class IntListPrompt(PromptBase):
         )
 
 
+# cwtensor instances shared by the commands run in this process, keyed by network.
+_CWTENSOR_CACHE: Dict[Optional[str], "cybertensor.cwtensor"] = {}
+
+
+def get_cwtensor(config: "Config") -> "cybertensor.cwtensor":
+    """Returns the cwtensor cached for the network of ``config``, constructing it on first use."""
+    # The connection only depends on the network, see cwtensor.setup_config.
+    cwtensor_config = config.get("cwtensor")
+    key = cwtensor_config.get("network") if cwtensor_config is not None else None
+    if key not in _CWTENSOR_CACHE:
+        _CWTENSOR_CACHE[key] = cybertensor.cwtensor(config=config, log_verbose=False)
+    return _CWTENSOR_CACHE[key]
+
+
+def clear_cwtensor_cache() -> None:
+    """Closes and drops every cwtensor created through :func:`get_cwtensor`."""
+    while _CWTENSOR_CACHE:
+        _, cwtensor = _CWTENSOR_CACHE.popitem()
+        cwtensor.close()
+        cybertensor.logging.debug("closing cwtensor connection")
+
+
+# Connections are kept for the life of the process and released on exit.
+atexit.register(clear_cwtensor_cache)
+
+
+def defer_args(
+    parser: argparse.ArgumentParser,
+    *add_args: Callable[[argparse.ArgumentParser], None],
+) -> None:
+    """
+    Defers ``add_args(parser)`` calls until ``parser``'s subcommand is selected on the
+    command line, see ``cli.__add_lazy_args__``.
+    """
+
+    def _build_args():
+        for add in add_args:
+            add(parser)
+        parser.set_defaults(_lazy_args=None)
+
+    parser.set_defaults(_lazy_args=_build_args)
+
+
+def get_cache_path(cwtensor: "cybertensor.cwtensor", *parts: str) -> str:
+    r"""Returns the path of a cache file under ``~/.cybertensor/cache`` for the cwtensor's network."""
+    return os.path.join(
+        os.path.expanduser(f"~/.cybertensor/cache/network-{cwtensor.network}"), *parts
+    )
+
+
+def write_cache_file(path: str, data: bytes) -> None:
+    r"""Replaces ``path`` with ``data`` atomically, so concurrent readers never see a partial file."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Read-only subnet query results are reused between CLI invocations for this many seconds.
+_SUBNET_QUERY_TTL = 10
+# Bump when a cached result's layout changes so stale caches are ignored.
+_SUBNET_QUERY_CACHE_VERSION = 1
+
+
+def _subnet_query_cache_path(
+    cwtensor: "cybertensor.cwtensor", query: str, netuid: Optional[int]
+) -> str:
+    name = query if netuid is None else f"{query}-{netuid}"
+    return get_cache_path(cwtensor, "subnet_queries", f"{name}.pkl")
+
+
+def cached_subnet_query(
+    cwtensor: "cybertensor.cwtensor", query: str, netuid: Optional[int] = None
+):
+    r"""Returns the result of ``cwtensor.<query>([netuid])``, cached on disk for ``_SUBNET_QUERY_TTL`` seconds."""
+    cache_path = _subnet_query_cache_path(cwtensor, query, netuid)
+    try:
+        if time.time() - os.stat(cache_path).st_mtime < _SUBNET_QUERY_TTL:
+            with open(cache_path, "rb") as f:
+                version, result = pickle.load(f)
+            if version == _SUBNET_QUERY_CACHE_VERSION:
+                return result
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        cybertensor.logging.debug(f"Ignoring subnet query cache {cache_path}: {e}")
+
+    args = () if netuid is None else (netuid,)
+    result = getattr(cwtensor, query)(*args)
+
+    try:
+        write_cache_file(
+            cache_path, pickle.dumps((_SUBNET_QUERY_CACHE_VERSION, result))
+        )
+    except Exception as e:
+        cybertensor.logging.debug(f"Failed to write subnet query cache {cache_path}: {e}")
+
+    return result
+
+
+def invalidate_subnet(
+    cwtensor: "cybertensor.cwtensor", netuid: Optional[int] = None
+) -> None:
+    r"""Drops the cached queries that may reflect the state of subnet ``netuid``, or of every subnet if ``netuid`` is ``None``."""
+    cache_dir = get_cache_path(cwtensor, "subnet_queries")
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        stem, _, ext = name.rpartition(".")
+        if ext != "pkl":
+            continue
+        _, sep, cached_netuid = stem.rpartition("-")
+        if netuid is None or not sep or cached_netuid == str(netuid):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
 def check_netuid_set(
     config: "Config",
     cwtensor: "cybertensor.cwtensor",
@@ -176,12 +312,72 @@ def get_all_wallets_for_path(path: str) -> List["Wallet"]:
     return all_wallets
 
 
+# Number of blocks for which on-disk hotkey registrations are reused between runs.
+_HOTKEY_NETUIDS_CACHE_BLOCKS = 10
+
+
+def _get_netuids_for_hotkeys(
+    cwtensor: "cybertensor.cwtensor", hotkeys: List[str], block: int
+) -> Dict[str, List[int]]:
+    r"""Returns the netuids each hotkey is registered on, cached on disk for ``_HOTKEY_NETUIDS_CACHE_BLOCKS`` blocks."""
+    cache_path = get_cache_path(cwtensor, "hotkey_netuids.json")
+    window = block // _HOTKEY_NETUIDS_CACHE_BLOCKS
+    hotkey_netuids: Dict[str, List[int]] = {}
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+        if cache["window"] == window:
+            hotkey_netuids = cache["netuids"]
+    except Exception as e:
+        cybertensor.logging.debug(f"Ignoring hotkey netuids cache {cache_path}: {e}")
+
+    missing = [hotkey for hotkey in hotkeys if hotkey not in hotkey_netuids]
+    if not missing:
+        return hotkey_netuids
+    for hotkey in missing:
+        hotkey_netuids[hotkey] = cwtensor.get_netuids_for_hotkey(hotkey)
+
+    try:
+        write_cache_file(
+            cache_path,
+            json.dumps({"window": window, "netuids": hotkey_netuids}).encode(),
+        )
+    except OSError as e:
+        cybertensor.logging.debug(f"Failed to write hotkey netuids cache {cache_path}: {e}")
+
+    return hotkey_netuids
+
+
+def invalidate_hotkey_netuids(cwtensor: "cybertensor.cwtensor", hotkey: str) -> None:
+    r"""Drops the cached netuids of ``hotkey`` so the next lookup queries the chain."""
+    cache_path = get_cache_path(cwtensor, "hotkey_netuids.json")
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+        if cache["netuids"].pop(hotkey, None) is None:
+            return
+        write_cache_file(cache_path, json.dumps(cache).encode())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        cybertensor.logging.debug(f"Failed to update hotkey netuids cache {cache_path}: {e}")
+
+
 def filter_netuids_by_registered_hotkeys(
-    cli, cwtensor, netuids, all_hotkeys
+    cli, cwtensor, netuids, all_hotkeys, block: Optional[int] = None
 ) -> List[int]:
+    hotkey_netuids = (
+        _get_netuids_for_hotkeys(
+            cwtensor, [wallet.hotkey.address for wallet in all_hotkeys], block
+        )
+        if block is not None
+        else {}
+    )
     netuids_with_registered_hotkeys = []
     for wallet in all_hotkeys:
-        netuids_list = cwtensor.get_netuids_for_hotkey(wallet.hotkey.address)
+        netuids_list = hotkey_netuids.get(wallet.hotkey.address)
+        if netuids_list is None:
+            netuids_list = cwtensor.get_netuids_for_hotkey(wallet.hotkey.address)
         cybertensor.logging.debug(
             f"Hotkey {wallet.hotkey.address} registered in netuids: {netuids_list}"
         )
@@ -22,6 +22,7 @@ import copy
 import os
 from typing import List, Dict, Union, Optional, Tuple, TypeVar
 
+import numpy as np
 import torch
 from cosmpy.aerial.client import LedgerClient
 from cosmpy.aerial.contract import LedgerContract
@@ -78,6 +79,18 @@ logger = logger.opt(colors=True)
 T = TypeVar("T")
 
 
+# LedgerClients (and their gRPC channels) shared by all cwtensor instances, keyed by endpoint.
+_LEDGER_CLIENTS: Dict[Tuple[str, str], LedgerClient] = {}
+
+
+def _get_ledger_client(network_config: "cybertensor.NetworkConfigCwTensor") -> LedgerClient:
+    key = (network_config.chain_id, network_config.url)
+    client = _LEDGER_CLIENTS.get(key)
+    if client is None:
+        client = _LEDGER_CLIENTS[key] = LedgerClient(cfg=network_config)
+    return client
+
+
 class cwtensor:
     """Factory Class for cybertensor.cwtensor
 
@@ -308,7 +321,7 @@ class cwtensor:
         self.giga_token_symbol = self.network_config.giga_token_symbol
 
         # Set up params.
-        self.client = LedgerClient(cfg=self.network_config)
+        self.client = _get_ledger_client(self.network_config)
         self.contract = LedgerContract(
             path=cybertensor.__contract_path__,
             client=self.client,
@@ -444,7 +457,8 @@ class cwtensor:
 
     def close(self):
         """
-        Cleans up resources for this cwtensor instance like active websocket connection and active extensions
+        Cleans up resources for this cwtensor instance like active websocket connection and active extensions.
+        The underlying LedgerClient is shared between instances and is left open.
         """
         pass
 
@@ -608,8 +622,8 @@ class cwtensor:
         self,
         wallet: "Wallet",
         netuid: int,
-        uids: Union[torch.LongTensor, torch.Tensor, list],
-        weights: Union[torch.FloatTensor, torch.Tensor, list],
+        uids: Union[torch.LongTensor, torch.Tensor, np.ndarray, list],
+        weights: Union[torch.FloatTensor, torch.Tensor, np.ndarray, list],
         version_key: int = cybertensor.__version_as_int__,
         uid: Optional[int] = None,
         wait_for_finalization: bool = True,
@@ -625,8 +639,8 @@ class cwtensor:
             wallet (cybertensor.Wallet): The wallet associated with the neuron setting the weights.
             netuid (int): The unique identifier of the subnet.
             uid (int): Unique identifier for the caller on the subnet specified by `netuid`.
-            uids (Union[torch.LongTensor, list]): The list of neuron UIDs that the weights are being set for.
-            weights (Union[torch.FloatTensor, list]): The corresponding weights to be set for each UID.
+            uids (Union[torch.LongTensor, np.ndarray, list]): The list of neuron UIDs that the weights are being set for.
+            weights (Union[torch.FloatTensor, np.ndarray, list]): The corresponding weights to be set for each UID.
             version_key (int, optional): Version key for compatibility with the network.
             wait_for_finalization (bool, optional): Waits for the transaction to be finalized on the blockchain.
             prompt (bool, optional): If ``True``, prompts for user confirmation before proceeding.
@@ -1638,6 +1652,22 @@ class cwtensor:
         )
         return Balance.from_boot(resp) if resp is not None else Balance(0)
 
+    def get_total_stake_for_coldkeys(self, addresses: List[str]) -> Dict[str, "Balance"]:
+        """Returns the total stake held on each coldkey across all hotkeys including delegates, using a single query"""
+        resp = self.contract.query(
+            {"get_stake_info_for_coldkeys": {"coldkeys": addresses}}
+        )
+        stake_info_map = (
+            StakeInfo.list_of_tuple_from_list_any(resp) if resp is not None else {}
+        )
+        return {
+            address: sum(
+                (stake_info.stake for stake_info in stake_info_map.get(address, [])),
+                Balance(0),
+            )
+            for address in addresses
+        }
+
     def get_stake_for_coldkey_and_hotkey(
         self, hotkey: str, coldkey: str, block: Optional[int] = None
     ) -> Optional["Balance"]:
@@ -17,6 +17,7 @@
 
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from cosmpy.aerial.wallet import LocalWallet
 from cosmpy.crypto.keypairs import PrivateKey
@@ -51,8 +52,14 @@ def register_subnetwork_message(
             Flag is ``true`` if extrinsic was finalized or included in the block.
             If we did not wait for finalization / inclusion, the response is ``true``.
     """
-    your_balance = cwtensor.get_balance(wallet.coldkeypub.address)
-    burn_cost = Balance(cwtensor.get_subnet_burn_cost())
+    # The balance and lock cost queries are independent, issue them together.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        balance_future = executor.submit(
+            cwtensor.get_balance, wallet.coldkeypub.address
+        )
+        burn_cost_future = executor.submit(cwtensor.get_subnet_burn_cost)
+        your_balance = balance_future.result()
+        burn_cost = Balance(burn_cost_future.result())
     if burn_cost > your_balance:
         console.print(
             f"Your balance of: [green]{your_balance}[/green] is not enough to pay the subnet lock cost of: "
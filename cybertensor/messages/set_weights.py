@@ -19,6 +19,7 @@
 
 from typing import Union, Tuple
 
+import numpy as np
 import torch
 from loguru import logger
 from rich.prompt import Confirm
@@ -35,8 +36,8 @@ def set_weights_message(
     cwtensor: "cybertensor.cwtensor",
     wallet: "Wallet",
     netuid: int,
-    uids: Union[torch.LongTensor, list],
-    weights: Union[torch.FloatTensor, list],
+    uids: Union[torch.LongTensor, np.ndarray, list],
+    weights: Union[torch.FloatTensor, np.ndarray, list],
     version_key: int = 0,
     wait_for_finalization: bool = True,
     prompt: bool = False,
@@ -49,9 +50,9 @@ def set_weights_message(
             cybertensor wallet object.
         netuid (int):
             netuid of the subnet to set weights for.
-        uids (Union[torch.LongTensor, list]):
+        uids (Union[torch.LongTensor, np.ndarray, list]):
             uint64 uids of destination neurons.
-        weights ( Union[torch.FloatTensor, list]):
+        weights (Union[torch.FloatTensor, np.ndarray, list]):
             weights to set which must floats and correspond to the passed uids.
         version_key (int):
             version key of the validator.
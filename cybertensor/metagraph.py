@@ -576,16 +576,21 @@ class metagraph(torch.nn.Module):
             )
         return tensor_param
 
-    def save(self) -> "metagraph":
+    def save(self, overwrite: bool = True) -> "metagraph":
         """
         Save the state of the metagraph object.
 
+        Args:
+            overwrite (bool): If ``False``, keep an existing snapshot of the same block instead of re-serializing it.
+
         Returns:
             metagraph: Updated metagraph object.
         """
         save_directory = get_save_dir(self.network, self.netuid)
         os.makedirs(save_directory, exist_ok=True)
         graph_file = save_directory + f"/block-{self.block.item()}.pt"
+        if not overwrite and os.path.exists(graph_file):
+            return self
         state_dict = self.state_dict()
         state_dict["axons"] = self.axons
         torch.save(state_dict, graph_file)
@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 def get_human_readable(num, suffix="H"):
     for unit in ["", "K", "M", "G", "T", "P", "E", "Z"]:
@@ -20,3 +22,16 @@ def millify(n: int):
     )
 
     return "{:.2f}{}".format(n / 10 ** (3 * millidx), millnames[millidx])
+
+
+def millify_array(values) -> np.ndarray:
+    """Vectorized :func:`millify`, formats every value of ``values`` at once."""
+    millnames = np.array(["", " K", " M", " B", " T"])
+    values = np.asarray(values, dtype=np.float64)
+    millidx = np.zeros(values.shape, dtype=np.int64)
+    nonzero = values != 0
+    millidx[nonzero] = np.floor(np.log10(np.abs(values[nonzero])) / 3)
+    np.clip(millidx, 0, len(millnames) - 1, out=millidx)
+
+    scaled = values / 10.0 ** (3 * millidx)
+    return np.char.add(np.char.mod("%.2f", scaled), millnames[millidx])